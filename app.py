@@ -1,11 +1,10 @@
 import streamlit as st
 import os
-import torch
 import time
 
 # Import your logic
 from data_ingestion import scrape_url, parse_pdf, chunk_text
-from embedding import generate_embeddings, VectorStore
+from embedding import generate_embeddings, CollectionManager
 from rag_engine import retrieve_top_k, generate_answer
 
 # --- 1. PAGE CONFIGURATION ---
@@ -26,14 +25,14 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # --- 3. SESSION STATE SETUP ---
-if "store" not in st.session_state:
-    st.session_state.store = VectorStore()
-    if os.path.exists("vector_store.pt"):
-        try:
-            state = torch.load("vector_store.pt")
-            st.session_state.store.add_data(state["chunks"], state["embeddings"])
-        except:
-            pass
+# One manager shared by every session: collections are loaded on first use
+# and the least recently used ones are unloaded when over the RAM budget.
+@st.cache_resource
+def get_collections():
+    max_memory_mb = int(os.getenv("RAG_MAX_MEMORY_MB", "512"))
+    return CollectionManager("collections", max_memory_mb, "vector_store.pt")
+
+collections = get_collections()
 
 if "messages" not in st.session_state:
     st.session_state.messages = []
@@ -46,6 +45,22 @@ with st.sidebar:
     # API key box removed from here! 
     # It now uses the key from your .env / rag_engine.py automatically.
 
+    collection = st.text_input(
+        "Collection",
+        value=CollectionManager.DEFAULT,
+        help="Lowercase letters, numbers, '-' or '_'"
+    )
+    # Don't show answers from another collection as if they came from this one
+    if st.session_state.get("collection") != collection:
+        st.session_state.collection = collection
+        st.session_state.messages = []
+    try:
+        store = collections.get(collection)
+    except (ValueError, RuntimeError) as e:
+        # Bad name, or the collection file exists but could not be loaded
+        st.error(str(e))
+        st.stop()
+
     st.subheader("Add Data")
     tab1, tab2 = st.tabs(["🌐 Web", "📄 PDF"])
     
@@ -67,15 +82,14 @@ with st.sidebar:
                         chunks = chunk_text(raw_text, chunk_size=500, source=url_input)
                         st.write("Generating AI embeddings...")
                         vectors = generate_embeddings(chunks)
-                        st.session_state.store.add_data(chunks, vectors)
-                        
-                        torch.save({
-                            "chunks": st.session_state.store.chunks,
-                            "embeddings": st.session_state.store.embeddings
-                        }, "vector_store.pt")
-                        
-                        status.update(label="Knowledge Added!", state="complete", expanded=False)
-                        st.toast(f"Added {len(chunks)} chunks from URL", icon="✅")
+                        try:
+                            # add() returns the updated store; the old one isn't changed
+                            store = collections.add(collection, chunks, vectors)
+                            status.update(label="Knowledge Added!", state="complete", expanded=False)
+                            st.toast(f"Added {len(chunks)} chunks from URL", icon="✅")
+                        except (RuntimeError, OSError) as e:
+                            status.update(label="Failed", state="error")
+                            st.error(f"Could not save collection: {e}")
 
     # PDF Tab
     with tab2:
@@ -88,24 +102,20 @@ with st.sidebar:
                 st.write("Chunking & Embedding...")
                 chunks = chunk_text(raw_text, chunk_size=500, source=uploaded_file.name)
                 vectors = generate_embeddings(chunks)
-                st.session_state.store.add_data(chunks, vectors)
-                
-                torch.save({
-                    "chunks": st.session_state.store.chunks,
-                    "embeddings": st.session_state.store.embeddings
-                }, "vector_store.pt")
-                
-                status.update(label="PDF Ingested!", state="complete", expanded=False)
-                st.toast(f"Added {len(chunks)} chunks from PDF", icon="📄")
+                try:
+                    store = collections.add(collection, chunks, vectors)
+                    status.update(label="PDF Ingested!", state="complete", expanded=False)
+                    st.toast(f"Added {len(chunks)} chunks from PDF", icon="📄")
+                except (RuntimeError, OSError) as e:
+                    status.update(label="Failed", state="error")
+                    st.error(f"Could not save collection: {e}")
 
     st.markdown("---")
-    doc_count = len(st.session_state.store.chunks)
+    doc_count = len(store.chunks)
     st.metric("Total Memories", doc_count)
     
     if st.button("🗑️ Reset Brain"):
-        if os.path.exists("vector_store.pt"):
-            os.remove("vector_store.pt")
-        st.session_state.store = VectorStore()
+        collections.reset(collection)
         st.session_state.messages = []
         st.rerun()
 
@@ -127,7 +137,7 @@ if query := st.chat_input("Ask me anything about your data..."):
     with st.chat_message("user"):
         st.markdown(query)
 
-    if not st.session_state.store.chunks:
+    if not store.chunks:
         response = "🚫 **Brain Empty!** Please add some data in the sidebar first."
         with st.chat_message("assistant"):
             st.error(response)
@@ -138,7 +148,7 @@ if query := st.chat_input("Ask me anything about your data..."):
             thinking_placeholder.markdown("🧠 *Thinking...*")
             
             # Step A: Retrieve
-            relevant_chunks = retrieve_top_k(query, st.session_state.store, k=5)
+            relevant_chunks = retrieve_top_k(query, store, k=5)
             
             # Step B: Generate (Automatically uses rag_engine's API logic)
             ai_response = generate_answer(query, relevant_chunks)
@@ -1,6 +1,9 @@
 from sentence_transformers import SentenceTransformer
 import torch
 import os
+import re
+import threading
+from collections import OrderedDict
 # 1. INITIALIZE MODEL
 # We load the model once to avoid reloading it every time we process text.
 # 'all-MiniLM-L6-v2' is a lightweight model perfect for CPU use.
@@ -47,6 +50,176 @@ class VectorStore:
             # Concatenate the new vectors to the existing list of vectors
             self.embeddings = torch.cat((self.embeddings, new_embeddings), dim=0)
 
+    def memory_bytes(self):
+        """
+        Rough estimate of how much RAM this store is using (vectors + text).
+        """
+        size = sum(len(chunk['text']) for chunk in self.chunks)
+        if self.embeddings is not None:
+            size += self.embeddings.element_size() * self.embeddings.nelement()
+        return size
+
+class CollectionManager:
+    """
+    Holds many named VectorStores ("collections"), each saved in its own file.
+    A collection is only loaded from disk the first time it is used, and the
+    least recently used ones are dropped from memory once the RAM budget is
+    exceeded. Everything is saved to disk on every change, so dropping a
+    collection from memory never loses data.
+
+    Cached stores are never changed in place: `add` builds a new VectorStore
+    and swaps it in, so a store returned by `get` can be searched safely
+    while other requests add data to the same collection.
+    """
+    DEFAULT = "default"
+    # Lowercase only: on Windows/Mac "HR" and "hr" would be the same file
+    NAME_PATTERN = re.compile(r"[a-z0-9_-]{1,64}")
+
+    def __init__(self, base_dir="collections", max_memory_mb=512, default_file="vector_store.pt"):
+        self.base_dir = base_dir
+        self.max_bytes = max_memory_mb * 1024 * 1024
+        # The "default" collection keeps using the old single-store file
+        self.default_file = default_file
+        self.stores = OrderedDict()  # name -> VectorStore, oldest use first
+        self.sizes = {}              # name -> memory_bytes() of the cached store
+        # `lock` only guards the dicts above and is never held during file I/O.
+        # Loading/saving a collection is serialised by that collection's own lock.
+        self.lock = threading.Lock()
+        self.collection_locks = {}
+
+    def validate_name(self, name):
+        """
+        Raises ValueError if the collection name is not allowed.
+        """
+        if not self.NAME_PATTERN.fullmatch(name or ""):
+            raise ValueError(f"Invalid collection name: '{name}'. Use lowercase letters, numbers, '-' or '_'.")
+
+    def _path(self, name):
+        self.validate_name(name)
+        if name == self.DEFAULT:
+            return self.default_file
+        return os.path.join(self.base_dir, f"{name}.pt")
+
+    def _collection_lock(self, name):
+        with self.lock:
+            return self.collection_locks.setdefault(name, threading.RLock())
+
+    def _load(self, name):
+        # Raises instead of returning an empty store, so a file that failed to
+        # load is never cached (and later overwritten) as an empty collection.
+        store = VectorStore()
+        path = self._path(name)
+        if os.path.exists(path):
+            try:
+                state = torch.load(path)
+                store.add_data(state["chunks"], state["embeddings"])
+            except Exception as e:
+                raise RuntimeError(f"Failed to load collection '{name}': {e}") from e
+            print(f"Loaded collection '{name}' with {len(store.chunks)} chunks.")
+        return store
+
+    def _cache(self, name, store, size):
+        # Must be called with self.lock held
+        self.stores[name] = store
+        self.stores.move_to_end(name)
+        self.sizes[name] = size
+        self._evict(keep=name)
+
+    def _evict(self, keep):
+        # Drop the least recently used collections until we fit the budget.
+        # The collection currently in use is never evicted.
+        used = sum(self.sizes.values())
+        for name in list(self.stores):
+            if used <= self.max_bytes:
+                break
+            if name == keep:
+                continue
+            del self.stores[name]
+            used -= self.sizes.pop(name)
+            print(f"Evicted collection '{name}' from memory.")
+
+    def get(self, name=DEFAULT):
+        """
+        Returns the VectorStore for a collection, loading it from disk if needed.
+        Raises ValueError for a bad name and RuntimeError if the file is unreadable.
+        """
+        self.validate_name(name)
+        with self.lock:
+            if name in self.stores:
+                self.stores.move_to_end(name)
+                return self.stores[name]
+
+        with self._collection_lock(name):
+            # Another request may have loaded it while we waited
+            with self.lock:
+                if name in self.stores:
+                    self.stores.move_to_end(name)
+                    return self.stores[name]
+            store = self._load(name)
+            size = store.memory_bytes()
+            with self.lock:
+                self._cache(name, store, size)
+            return store
+
+    def add(self, name, new_chunks, new_embeddings):
+        """
+        Adds data to a collection, saves it to disk and returns the new store.
+        Memory is only updated once the file has been written successfully.
+        """
+        with self._collection_lock(name):
+            current = self.get(name)
+            store = VectorStore()
+            store.add_data(list(current.chunks), current.embeddings)
+            store.add_data(new_chunks, new_embeddings)
+
+            # Write to a temp file first so a crash can't leave a truncated .pt
+            path = self._path(name)
+            if os.path.dirname(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + ".tmp"
+            try:
+                torch.save({"chunks": store.chunks, "embeddings": store.embeddings}, tmp_path)
+                os.replace(tmp_path, path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+            size = store.memory_bytes()
+            with self.lock:
+                self._cache(name, store, size)
+            return store
+
+    def reset(self, name=DEFAULT):
+        """
+        Clears a collection from memory and deletes its file.
+        """
+        path = self._path(name)
+        with self._collection_lock(name):
+            with self.lock:
+                self.stores.pop(name, None)
+                self.sizes.pop(name, None)
+            if os.path.exists(path):
+                os.remove(path)
+
+    def list_collections(self):
+        """
+        Names of all collections saved on disk (loaded or not).
+        """
+        with self.lock:
+            names = set(self.stores)
+        if os.path.exists(self.default_file):
+            names.add(self.DEFAULT)
+        if os.path.isdir(self.base_dir):
+            names.update(f[:-3] for f in os.listdir(self.base_dir) if f.endswith(".pt"))
+        return sorted(names)
+
+    def loaded_collections(self):
+        """
+        Names of the collections currently held in memory.
+        """
+        with self.lock:
+            return list(self.stores)
+
 # --- TERMINAL TEST BLOCK ---
 # This runs only if you execute: python embedding.py
 if __name__ == "__main__":
@@ -101,4 +274,49 @@ if __name__ == "__main__":
     torch.save(db_state, OUTPUT_FILE)
     
     print(f"✅ Success! Data saved to '{OUTPUT_FILE}'.")
-    print(f"{SEPARATOR}\n")
\ No newline at end of file
+    print(f"{SEPARATOR}\n")
+
+    print(f"{SEPARATOR}")
+    print(" 4. TESTING COLLECTIONS (Lazy Loading + LRU) ")
+    print(SEPARATOR)
+
+    import tempfile
+
+    # Work in a temp folder so we don't touch the real collections
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        one_store = VectorStore()
+        one_store.add_data(chunks, vectors)
+        # Budget fits one collection, but not two
+        budget_mb = one_store.memory_bytes() * 1.5 / (1024 * 1024)
+
+        manager = CollectionManager(
+            base_dir=os.path.join(tmp_dir, "collections"),
+            max_memory_mb=budget_mb,
+            default_file=os.path.join(tmp_dir, "vector_store.pt")
+        )
+
+        # a) Name checks
+        for bad_name in ["HR", "team a", "../escape", "foo\n", ""]:
+            try:
+                manager.validate_name(bad_name)
+                print(f"❌ Name {bad_name!r} was accepted.")
+            except ValueError:
+                print(f"✅ Name {bad_name!r} rejected.")
+
+        # b) Two collections that don't both fit in the budget
+        manager.add("team-a", chunks, vectors)
+        print(f"Loaded after adding team-a: {manager.loaded_collections()}")
+        manager.add("team-b", chunks, vectors)
+        print(f"Loaded after adding team-b: {manager.loaded_collections()}")
+        assert manager.loaded_collections() == ["team-b"], "team-a should have been evicted"
+        print("✅ Least recently used collection (team-a) was evicted.")
+
+        # c) Using team-a again reloads it from disk and evicts team-b
+        store_a = manager.get("team-a")
+        assert len(store_a.chunks) == len(chunks), "team-a lost data"
+        assert manager.loaded_collections() == ["team-a"], "team-b should have been evicted"
+        print(f"✅ team-a reloaded from disk with {len(store_a.chunks)} chunks.")
+
+        print(f"All collections on disk: {manager.list_collections()}")
+
+    print(f"{SEPARATOR}\n")
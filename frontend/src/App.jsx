@@ -6,6 +6,7 @@ function App() {
   const [input, setInput] = useState("");
   const [url, setUrl] = useState("");
   const [file, setFile] = useState(null);
+  const [collection, setCollection] = useState("default");
   
   // New States for UI feedback
   const [chatLoading, setChatLoading] = useState(false);
@@ -32,7 +33,7 @@ function App() {
       const response = await fetch("http://localhost:8000/chat", {
         method: "POST",
         headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ query: userMsg.text })
+        body: JSON.stringify({ query: userMsg.text, collection })
       });
 
       const data = await response.json();
@@ -62,7 +63,7 @@ function App() {
       const res = await fetch("http://localhost:8000/ingest/url", {
         method: "POST",
         headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ url })
+        body: JSON.stringify({ url, collection })
       });
       const data = await res.json();
       
@@ -93,6 +94,7 @@ function App() {
 
     const formData = new FormData();
     formData.append("file", file);
+    formData.append("collection", collection);
 
     try {
       const res = await fetch("http://localhost:8000/ingest/pdf", {
@@ -122,6 +124,19 @@ function App() {
       {/* Sidebar */}
       <div className="sidebar">
         <h2>Knowledge Base</h2>
+
+        <div className="input-group">
+          <label>Collection (lowercase, numbers, - or _)</label>
+          <input 
+            type="text" 
+            placeholder="default" 
+            value={collection} 
+            onChange={(e) => {
+              setCollection(e.target.value);
+              setMessages([]);
+            }}
+          />
+        </div>
         
         {/* Status Notification Box */}
         {statusMessage && (
@@ -163,9 +178,17 @@ function App() {
 
         <button className="reset-btn" onClick={async () => {
             if(window.confirm("Are you sure you want to clear the brain?")) {
-              await fetch("http://localhost:8000/reset", { method: "POST" });
-              setMessages([]);
-              setStatusMessage("✨ Brain Reset!");
+              try {
+                const res = await fetch(`http://localhost:8000/reset?collection=${encodeURIComponent(collection)}`, { method: "POST" });
+                const data = await res.json();
+
+                if (!res.ok) throw new Error(data.detail);
+
+                setMessages([]);
+                setStatusMessage("✨ Brain Reset!");
+              } catch (err) {
+                setStatusMessage("❌ Failed: " + err.message);
+              }
             }
         }}>
           🗑️ Reset Brain
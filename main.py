@@ -1,13 +1,12 @@
-from fastapi import FastAPI, UploadFile, File, HTTPException
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import os
-import torch
 import shutil
 
 # Import your existing logic
 from data_ingestion import scrape_url, parse_pdf, chunk_text
-from embedding import generate_embeddings, VectorStore
+from embedding import generate_embeddings, CollectionManager
 from rag_engine import retrieve_top_k, generate_answer
 from dotenv import load_dotenv
 
@@ -24,34 +23,53 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global State (The Brain)
-store = VectorStore()
-DB_FILE = "vector_store.pt"
+# Global State (The Brains)
+# Each named collection has its own file. Collections are loaded on first use
+# and the least recently used ones are unloaded when over the RAM budget.
+DB_FILE = "vector_store.pt"            # File of the "default" collection
+COLLECTIONS_DIR = "collections"        # Files of every other collection
+MAX_MEMORY_MB = int(os.getenv("RAG_MAX_MEMORY_MB", "512"))
 
-# Load existing brain on startup
-if os.path.exists(DB_FILE):
+collections = CollectionManager(COLLECTIONS_DIR, MAX_MEMORY_MB, DB_FILE)
+
+def get_store(name):
     try:
-        state = torch.load(DB_FILE)
-        store.add_data(state["chunks"], state["embeddings"])
-        print(f"Loaded {len(store.chunks)} chunks.")
-    except Exception as e:
-        print(f"Failed to load DB: {e}")
+        return collections.get(name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        # The collection file exists but could not be loaded
+        raise HTTPException(status_code=500, detail=str(e))
+
+def validate_collection(name):
+    try:
+        collections.validate_name(name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 # --- Data Models ---
 class UrlRequest(BaseModel):
     url: str
+    collection: str = CollectionManager.DEFAULT
 
 class QueryRequest(BaseModel):
     query: str
+    collection: str = CollectionManager.DEFAULT
 
 # --- API Endpoints ---
 
 @app.get("/")
 def home():
-    return {"status": "active", "docs": len(store.chunks)}
+    return {
+        "status": "active",
+        "docs": len(get_store(CollectionManager.DEFAULT).chunks),
+        "collections": collections.list_collections(),
+        "loaded": collections.loaded_collections()
+    }
 
 @app.post("/ingest/url")
 def ingest_url(request: UrlRequest):
+    validate_collection(request.collection)
     try:
         raw_text = scrape_url(request.url)
         if "Error" in raw_text:
@@ -59,17 +77,17 @@ def ingest_url(request: UrlRequest):
             
         chunks = chunk_text(raw_text, chunk_size=500, source=request.url)
         vectors = generate_embeddings(chunks)
-        store.add_data(chunks, vectors)
         
-        # Save to disk
-        torch.save({"chunks": store.chunks, "embeddings": store.embeddings}, DB_FILE)
+        # Add to the collection and save it to disk
+        collections.add(request.collection, chunks, vectors)
         
-        return {"message": f"Successfully added {len(chunks)} chunks from URL."}
+        return {"message": f"Successfully added {len(chunks)} chunks from URL to '{request.collection}'."}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/ingest/pdf")
-async def ingest_pdf(file: UploadFile = File(...)):
+def ingest_pdf(file: UploadFile = File(...), collection: str = Form(CollectionManager.DEFAULT)):
+    validate_collection(collection)
     try:
         # Save temp file
         with open(f"temp_{file.filename}", "wb") as buffer:
@@ -84,18 +102,17 @@ async def ingest_pdf(file: UploadFile = File(...)):
         
         chunks = chunk_text(raw_text, chunk_size=500, source=file.filename)
         vectors = generate_embeddings(chunks)
-        store.add_data(chunks, vectors)
+        collections.add(collection, chunks, vectors)
         
-        torch.save({"chunks": store.chunks, "embeddings": store.embeddings}, DB_FILE)
-        
-        return {"message": f"Successfully added {len(chunks)} chunks from PDF."}
+        return {"message": f"Successfully added {len(chunks)} chunks from PDF to '{collection}'."}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/chat")
 def chat(request: QueryRequest):
+    store = get_store(request.collection)
     if not store.chunks:
-        raise HTTPException(status_code=400, detail="Database is empty. Add documents first.")
+        raise HTTPException(status_code=400, detail=f"Collection '{request.collection}' is empty. Add documents first.")
     
     # 1. Retrieve
     relevant_chunks = retrieve_top_k(request.query, store, k=5)
@@ -112,9 +129,9 @@ def chat(request: QueryRequest):
     }
 
 @app.post("/reset")
-def reset_db():
-    global store
-    store = VectorStore()
-    if os.path.exists(DB_FILE):
-        os.remove(DB_FILE)
-    return {"message": "Knowledge base cleared."}
\ No newline at end of file
+def reset_db(collection: str = CollectionManager.DEFAULT):
+    try:
+        collections.reset(collection)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"message": f"Knowledge base '{collection}' cleared."}
\ No newline at end of file